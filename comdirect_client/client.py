@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Optional, cast
 
 import httpx
+import orjson
 
 from comdirect_client.exceptions import (
     AccountNotFoundError,
@@ -20,11 +21,21 @@ from comdirect_client.exceptions import (
     TokenExpiredError,
     ValidationError,
 )
-from comdirect_client.models import AccountBalance, Transaction
+from comdirect_client.models import AccountBalance, Transaction, _clear_parse_caches
 from comdirect_client.token_storage import TokenPersistence, TokenStorageError
 
 logger = logging.getLogger(__name__)
 
+# Query parameters sent with every transactions request; copied per call
+_TRANSACTION_PARAMS: dict[str, str] = {"paging-count": "100"}
+
+# Only keepalive_expiry differs from httpx's defaults (30s instead of 5s), so pooled
+# connections survive between the balance/transaction calls of a session. The two
+# caps restate httpx's defaults: an explicit Limits() leaves unset caps unbounded.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
 
 def utc_now() -> datetime:
     """Get current UTC time as timezone-aware datetime."""
@@ -108,6 +119,7 @@ class ComdirectClient:
         token_refresh_threshold_seconds: int = 120,
         timeout_seconds: float = 30.0,
         token_storage_path: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the Comdirect API client.
 
@@ -121,10 +133,14 @@ class ComdirectClient:
             tan_status_callback: Optional callback function invoked during TAN approval process
                                Called with (status, data) where status is 'requested', 'pending', 'approved', 'timeout'
             token_refresh_threshold_seconds: Seconds before expiry to trigger refresh (default: 120)
-            timeout_seconds: HTTP request timeout in seconds (default: 30.0)
+            timeout_seconds: HTTP request timeout in seconds (default: 30.0).
+                             Ignored when http_client is given.
             token_storage_path: Optional file path to persist tokens for session recovery.
                                Enables loading saved tokens on client restart.
                                Parent directory must exist.
+            http_client: Optional preconfigured httpx.AsyncClient to use instead of
+                         building one (e.g. with a custom transport). Its own timeout
+                         applies; timeout_seconds is not used. It is closed by close().
 
         Raises:
             TokenStorageError: If token_storage_path directory doesn't exist
@@ -155,7 +171,11 @@ class ComdirectClient:
         self._refresh_task: Optional[asyncio.Task[None]] = None
 
         # HTTP client
-        self._http_client = httpx.AsyncClient(timeout=timeout_seconds)
+        self._http_client = (
+            http_client
+            if http_client is not None
+            else httpx.AsyncClient(timeout=timeout_seconds, limits=_HTTP_LIMITS)
+        )
 
         logger.info("ComdirectClient initialized")
 
@@ -874,9 +894,9 @@ class ComdirectClient:
                 raise ServerError("API server returned 500 Internal Server Error")
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            balances = [AccountBalance.from_dict(item) for item in data["values"]]
+            balances = list(map(AccountBalance.from_dict, data["values"]))
             logger.info(f"Retrieved {len(balances)} account balances")
             logger.debug(f"Parsed {len(balances)} account balance objects")
 
@@ -920,7 +940,7 @@ class ComdirectClient:
         await self._ensure_authenticated()
 
         # Build query parameters with maximum page size
-        params: dict[str, str] = {"paging-count": "100"}
+        params = _TRANSACTION_PARAMS.copy()
         if transaction_state:
             params["transactionState"] = transaction_state
         if transaction_direction:
@@ -979,9 +999,9 @@ class ComdirectClient:
                 raise ServerError("API server returned 500 Internal Server Error")
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            transactions = [Transaction.from_dict(item) for item in data["values"]]
+            transactions = list(map(Transaction.from_dict, data["values"]))
             logger.info(
                 f"Retrieved {len(transactions)} transactions for account {account_id[:8]}..."
             )
@@ -1006,6 +1026,7 @@ class ComdirectClient:
             self._refresh_task.cancel()
 
         await self._http_client.aclose()
+        _clear_parse_caches()
         logger.info("ComdirectClient closed")
 
     async def __aenter__(self) -> "ComdirectClient":
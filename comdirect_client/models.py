@@ -1,12 +1,31 @@
 """Data models for the Comdirect API client."""
 
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Optional
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, which adds
+# up when a single export builds thousands of transactions and nested objects.
+_DATACLASS_OPTIONS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@lru_cache(maxsize=1024)
+def _decimal(value: str) -> Decimal:
+    """Return a shared Decimal for an amount string; Decimals are immutable."""
+    return Decimal(value)
+
+
+@lru_cache(maxsize=512)
+def _iso_date(value: str) -> date:
+    """Return a shared date for an ISO date string; bookings cluster on few days."""
+    return date.fromisoformat(value)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AmountValue:
     """Represents a monetary amount with currency unit."""
 
@@ -16,12 +35,15 @@ class AmountValue:
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> "AmountValue":
         """Create AmountValue from API response dict."""
-        return cls(value=Decimal(data["value"]), unit=data["unit"])
+        return cls(value=_decimal(data["value"]), unit=sys.intern(data["unit"]))
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class EnumText:
-    """Represents an enumerated value with key and text description."""
+    """Represents an enumerated value with key and text description.
+
+    Instances are immutable so identical values can be shared (see _enum_text).
+    """
 
     key: str
     text: str
@@ -29,10 +51,16 @@ class EnumText:
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> "EnumText":
         """Create EnumText from API response dict."""
-        return cls(key=data["key"], text=data["text"])
+        return _enum_text(data["key"], data["text"])
+
+
+@lru_cache(maxsize=256)
+def _enum_text(key: str, text: str) -> EnumText:
+    """Return a shared EnumText; transactions repeat a handful of types."""
+    return EnumText(key=key, text=text)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class AccountInformation:
     """Account information for remitter/debtor/creditor."""
 
@@ -43,10 +71,18 @@ class AccountInformation:
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> "AccountInformation":
         """Create AccountInformation from API response dict."""
-        return cls(holderName=data["holderName"], iban=data.get("iban"), bic=data.get("bic"))
+        return _account_information(data["holderName"], data.get("iban"), data.get("bic"))
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _account_information(
+    holder_name: str, iban: Optional[str], bic: Optional[str]
+) -> AccountInformation:
+    """Return a shared AccountInformation; counterparties recur across a page."""
+    return AccountInformation(holderName=holder_name, iban=iban, bic=bic)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Account:
     """Account master data."""
 
@@ -71,12 +107,12 @@ class Account:
             iban=data.get("iban"),
             bic=data.get("bic"),
             creditLimit=(
-                AmountValue.from_dict(data["creditLimit"]) if "creditLimit" in data else None
+                AmountValue.from_dict(limit) if (limit := data.get("creditLimit")) else None
             ),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AccountBalance:
     """Account balance information."""
 
@@ -100,7 +136,18 @@ class AccountBalance:
         )
 
 
-def _parse_remittance_info(remittance: Optional[str]) -> list[str]:
+# Line markers in remittanceInfo: "01" at the start or after whitespace opens the
+# first line; in short format every following marker must also follow whitespace,
+# while long format accepts any two-digit pair (lookahead keeps matches overlapping).
+# Markers are always ASCII digits, so they are matched as such and compared as text.
+_FIRST_MARKER_RE = re.compile(r"(?<=\s)01")
+_SHORT_MARKER_RE = re.compile(r"(?<=\s)[0-9]{2}")
+_LONG_MARKER_RE = re.compile(r"(?=([0-9]{2}))")
+_MARKERS = tuple(f"{n:02d}" for n in range(100))
+
+
+@lru_cache(maxsize=4096)
+def _parse_remittance_info(remittance: Optional[str]) -> tuple[str, ...]:
     """Parse Comdirect remittanceInfo string into logical lines.
 
     The Comdirect API encodes line breaks in remittanceInfo by prefixing each
@@ -111,30 +158,33 @@ def _parse_remittance_info(remittance: Optional[str]) -> list[str]:
     2. Short format (test data): Markers with variable/close spacing
 
     This function adapts to detect which format is used and extracts lines accordingly.
+
+    Results are memoized: transactions frequently repeat the same remittance
+    text, and the returned tuple is immutable so cached values can be shared.
     """
 
     if not remittance:
-        return []
+        return ()
 
     text = remittance.strip()
     if not text:
-        return []
+        return ()
 
     length = len(text)
 
+    if "01" not in text:
+        # Plain text without any marker – skip the scan entirely
+        return (text,)
+
     # Find the first marker (01)
-    first_pos = -1
-    if length >= 2 and text[0:2] == "01":
+    if text.startswith("01"):
         first_pos = 0
     else:
-        for i in range(length - 2):
-            if text[i].isspace() and text[i + 1 : i + 3] == "01":
-                first_pos = i + 1
-                break
-
-    if first_pos == -1:
-        # No valid starting marker – treat entire string as single line
-        return [text]
+        first_match = _FIRST_MARKER_RE.search(text)
+        if first_match is None:
+            # No valid starting marker – treat entire string as single line
+            return (text,)
+        first_pos = first_match.start()
 
     # Detect format based on total length and marker spacing
     # Long format typically has 37-char intervals and total length > 100
@@ -150,59 +200,39 @@ def _parse_remittance_info(remittance: Optional[str]) -> list[str]:
         tolerance = 15
 
         while expected_marker <= 99:
-            found = False
             search_start = max(marker_positions[-1] + 20, expected_pos - tolerance)
             search_end = min(length - 1, expected_pos + tolerance)
 
-            for pos in range(search_start, search_end):
-                if pos + 1 < length and text[pos].isdigit() and text[pos + 1].isdigit():
-                    marker_value = int(text[pos : pos + 2])
-                    if marker_value == expected_marker:
-                        marker_positions.append(pos)
-                        expected_pos = pos + 37
-                        expected_marker += 1
-                        found = True
-                        break
-
-            if not found:
+            # A marker may start anywhere in [search_start, search_end)
+            for match in _LONG_MARKER_RE.finditer(text, search_start, search_end + 1):
+                if match.group(1) == _MARKERS[expected_marker]:
+                    pos = match.start()
+                    marker_positions.append(pos)
+                    expected_pos = pos + 37
+                    expected_marker += 1
+                    break
+            else:
                 break
     else:
-        # Short format: scan for markers that appear after whitespace
+        # Short format: markers must follow whitespace (not in middle of numbers/text)
         # This avoids false positives in timestamps like "2020-01-03T20:07:16"
-        while expected_marker <= 99:
-            found = False
-            search_start = marker_positions[-1] + 2
-
-            for pos in range(search_start, length - 1):
-                # Marker must be after whitespace (not in middle of numbers/text)
-                if (
-                    text[pos].isdigit()
-                    and text[pos + 1].isdigit()
-                    and (pos == 0 or text[pos - 1].isspace())
-                ):
-                    marker_value = int(text[pos : pos + 2])
-                    if marker_value == expected_marker:
-                        marker_positions.append(pos)
-                        expected_marker += 1
-                        found = True
-                        break
-
-            if not found:
-                break
+        for match in _SHORT_MARKER_RE.finditer(text, first_pos + 2):
+            if match.group() == _MARKERS[expected_marker]:
+                marker_positions.append(match.start())
+                expected_marker += 1
+                if expected_marker > 99:
+                    break
 
     # Extract lines between markers
-    lines: list[str] = []
-    for idx, pos in enumerate(marker_positions):
-        start = pos + 2  # skip the two-digit marker
-        end = marker_positions[idx + 1] if idx + 1 < len(marker_positions) else length
-        line = text[start:end].strip()
-        if line:
-            lines.append(line)
+    # (each line starts after its two-digit marker and ends at the next marker)
+    line_ends = marker_positions[1:] + [length]
+    segments = (text[pos + 2 : end] for pos, end in zip(marker_positions, line_ends))
+    lines = tuple(filter(None, map(str.strip, segments)))
 
-    return lines if lines else [text]
+    return lines if lines else (text,)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Transaction:
     """Bank account transaction.
 
@@ -230,21 +260,38 @@ class Transaction:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Transaction":
-        """Create Transaction from API response dict."""
-        booking_date = None
-        if data.get("bookingDate"):
-            booking_date = date.fromisoformat(data["bookingDate"])
+        """Create Transaction from API response dict.
 
-        # Handle optional nested objects safely
-        amount = None
-        if data.get("amount"):
-            amount = AmountValue.from_dict(data["amount"])
+        Nested amount/enum/account objects are constructed inline rather than
+        through their from_dict classmethods; this runs once per transaction.
+        """
+        booking_date = _iso_date(v) if (v := data.get("bookingDate")) else None
 
-        transaction_type = None
-        if data.get("transactionType"):
-            transaction_type = EnumText.from_dict(data["transactionType"])
+        # Handle optional nested objects safely
+        amount = (
+            AmountValue(_decimal(a["value"]), sys.intern(a["unit"]))
+            if (a := data.get("amount"))
+            else None
+        )
+        transaction_type = (
+            _enum_text(t["key"], t["text"]) if (t := data.get("transactionType")) else None
+        )
 
-        remittance_lines = _parse_remittance_info(data.get("remittanceInfo"))
+        remitter = (
+            _account_information(r["holderName"], r.get("iban"), r.get("bic"))
+            if (r := data.get("remitter"))
+            else None
+        )
+        debtor = (
+            _account_information(d["holderName"], d.get("iban"), d.get("bic"))
+            if (d := data.get("debtor") or data.get("deptor"))
+            else None
+        )
+        creditor = (
+            _account_information(c["holderName"], c.get("iban"), c.get("bic"))
+            if (c := data.get("creditor"))
+            else None
+        )
 
         return cls(
             bookingStatus=data["bookingStatus"],
@@ -252,20 +299,12 @@ class Transaction:
             reference=data["reference"],
             valutaDate=data["valutaDate"],
             transactionType=transaction_type,
-            remittanceLines=remittance_lines,
+            remittanceLines=list(_parse_remittance_info(data.get("remittanceInfo"))),
             newTransaction=data["newTransaction"],
             bookingDate=booking_date,
-            remitter=(
-                AccountInformation.from_dict(data["remitter"]) if data.get("remitter") else None
-            ),
-            debtor=(
-                AccountInformation.from_dict(data.get("debtor") or data.get("deptor", {}))
-                if data.get("debtor") or data.get("deptor")
-                else None
-            ),
-            creditor=(
-                AccountInformation.from_dict(data["creditor"]) if data.get("creditor") else None
-            ),
+            remitter=remitter,
+            debtor=debtor,
+            creditor=creditor,
             endToEndReference=data.get("endToEndReference"),
             directDebitCreditorId=data.get("directDebitCreditorId"),
             directDebitMandateId=data.get("directDebitMandateId"),
@@ -281,3 +320,17 @@ class Transaction:
         """
 
         return self.remittanceLines
+
+
+def _clear_parse_caches() -> None:
+    """Drop all memoized parse results.
+
+    The caches hold counterparty names, IBANs/BICs, remittance texts and amounts
+    from parsed responses; ComdirectClient.close() calls this so that data is not
+    retained for the life of the process.
+    """
+    _decimal.cache_clear()
+    _iso_date.cache_clear()
+    _enum_text.cache_clear()
+    _account_information.cache_clear()
+    _parse_remittance_info.cache_clear()
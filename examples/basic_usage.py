@@ -12,12 +12,14 @@ This example demonstrates:
 """
 
 import asyncio
-import json
 import logging
 import os
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
+import orjson
+
 from comdirect_client.client import ComdirectClient
 
 
@@ -30,41 +32,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _orjson_default(obj):
+    """Serialize types orjson does not handle natively (Decimal amounts)."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
 def write_transactions_to_json(transactions, filename="transactions.json"):
     """Write transactions to a JSON file.
 
+    Transaction dataclasses are serialized directly by orjson; only Decimal
+    amounts go through the Python-level default hook. Records are streamed
+    to the file one at a time, so only a single encoded transaction is held
+    in memory.
+
     Args:
         transactions: List of transaction objects
         filename: Output JSON filename
     """
     output_path = Path(filename)
 
-    # Convert transactions to JSON-serializable format
-    transactions_data = []
-    for tx in transactions:
-        tx_dict = {
-            "bookingStatus": tx.bookingStatus,
-            "reference": tx.reference,
-            "valutaDate": str(tx.valutaDate) if tx.valutaDate else None,
-            "newTransaction": tx.newTransaction,
-            "bookingDate": str(tx.bookingDate) if tx.bookingDate else None,
-            "remittanceLines": tx.remittance_lines,  # Parsed lines with markers stripped
-            "amount": {
-                "value": str(tx.amount.value) if tx.amount else None,
-                "unit": tx.amount.unit if tx.amount else None,
-            },
-            "transactionType": tx.transactionType.text if tx.transactionType else None,
-            "remitter": tx.remitter,
-            "debtor": tx.debtor,
-            "creditor": tx.creditor,
-        }
-        transactions_data.append(tx_dict)
-
-    # Write to JSON file
-    with open(output_path, "w") as f:
-        json.dump(transactions_data, f, indent=2, default=str)
-
-    logger.info(f"✅ Wrote {len(transactions_data)} transactions to {output_path}")
+    with output_path.open("wb") as f:
+        f.write(b"[")
+        for i, tx in enumerate(transactions):
+            f.write(b",\n" if i else b"\n")
+            f.write(orjson.dumps(tx, default=_orjson_default, option=orjson.OPT_INDENT_2))
+        f.write(b"\n]\n")
+
+    logger.info(f"✅ Wrote {len(transactions)} transactions to {output_path}")
 
 
 def reauth_callback(reason: str):
@@ -175,30 +171,33 @@ async def main():
         logger.info("=" * 60)
 
         if balances:
-            # Fetch all transactions from ALL accounts
-            all_transactions = []
-
-            for account in balances:
-                account_id = account.accountId
-                account_display = account.account.accountDisplayId
-
-                try:
-                    logger.info(f"\n📊 Fetching ALL transactions for account: {account_display}")
-
-                    # Fetch ALL transactions for this account (up to 500 most recent)
-                    transactions = await client.get_transactions(
-                        account_id=account_id,
+            # Fetch all transactions from ALL accounts concurrently
+            logger.info(f"\n📊 Fetching ALL transactions for {len(balances)} accounts")
+
+            # Fetch ALL transactions per account (up to 500 most recent each)
+            results = await asyncio.gather(
+                *(
+                    client.get_transactions(
+                        account_id=account.accountId,
                         # transaction_state="BOOKED",  # Optional: filter by booking state
                         # transaction_direction="DEBIT",  # Optional: filter by direction (CREDIT/DEBIT/CREDIT_AND_DEBIT)
                     )
+                    for account in balances
+                ),
+                return_exceptions=True,
+            )
 
-                    all_transactions.extend(transactions)
-                    logger.info(
-                        f"   ✅ Found {len(transactions)} transactions (max 500 per account)"
-                    )
+            all_transactions = []
+            for account, result in zip(balances, results):
+                account_display = account.account.accountDisplayId
+                if isinstance(result, BaseException):
+                    logger.error(f"❌ Failed to fetch transactions for {account_display}: {result}")
+                    continue
 
-                except Exception as e:
-                    logger.error(f"❌ Failed to fetch transactions for {account_display}: {e}")
+                all_transactions.extend(result)
+                logger.info(
+                    f"   ✅ {account_display}: {len(result)} transactions (max 500 per account)"
+                )
 
             logger.info("")
             logger.info("=" * 60)
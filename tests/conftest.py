@@ -1,9 +1,20 @@
 """Pytest configuration for Comdirect API client tests."""
 
+from datetime import datetime, timedelta, timezone
+
+import httpx
 import pytest
 
-# Configure pytest-asyncio
-pytest_plugins = ("pytest_asyncio",)
+from comdirect_client.client import ComdirectClient
+
+_CREDENTIALS = {
+    "client_id": "test_id",
+    "client_secret": "test_secret",
+    "username": "test_user",
+    "password": "test_pass",
+}
+
+# pytest-asyncio registers itself via its entry point; asyncio_mode is set in pyproject.toml
 
 
 @pytest.fixture(scope="session")
@@ -17,3 +28,71 @@ def log_capture(caplog):
     """Fixture to capture and configure logging."""
     caplog.set_level("DEBUG")
     return caplog
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Freeze the client's notion of "now" so token expiry checks are deterministic."""
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr("comdirect_client.client.utc_now", lambda: now)
+    return now
+
+
+class MockRouter:
+    """httpx.MockTransport handler serving canned JSON responses per URL path."""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def route(self, path, payload=None, status=200):
+        """Respond to requests for ``path`` with ``status`` and optional JSON ``payload``."""
+        self.routes[path] = (status, payload)
+
+    def reset(self):
+        self.routes.clear()
+        self.requests.clear()
+
+    def __call__(self, request):
+        self.requests.append(request)
+        status, payload = self.routes[request.url.path]
+        if payload is None:
+            return httpx.Response(status)
+        return httpx.Response(status, json=payload)
+
+
+@pytest.fixture(scope="session")
+def credentials():
+    """Keyword arguments for constructing a test ComdirectClient."""
+    return _CREDENTIALS
+
+
+@pytest.fixture(scope="module")
+def http_router():
+    """Route table for the shared client's HTTP transport (built once per module)."""
+    return MockRouter()
+
+
+@pytest.fixture(scope="module")
+def _shared_client(http_router):
+    """Create one client per module whose HTTP layer is served by ``http_router``."""
+    return ComdirectClient(
+        **_CREDENTIALS,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(http_router)),
+    )
+
+
+@pytest.fixture
+def authenticated_client(_shared_client, http_router, frozen_clock):
+    """Reset the module's shared client to an authenticated state for one test.
+
+    Tokens are valid for one hour on the frozen clock; routes and recorded
+    requests are cleared after the test.
+    """
+    _shared_client.reauth_callback = None
+    _shared_client._access_token = "test_access_token"
+    _shared_client._refresh_token = "test_refresh_token"
+    _shared_client._token_expiry = frozen_clock + timedelta(hours=1)
+    _shared_client._session_id = "test_session_id"
+    yield _shared_client
+    http_router.reset()
@@ -1,81 +1,19 @@
 """API operation tests - account balances and transactions."""
 
-import json
 import logging
 from datetime import date
 from decimal import Decimal
-from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
 
-import httpx
 import pytest
 
-from comdirect_client.client import ComdirectClient
 from comdirect_client.exceptions import AccountNotFoundError, ValidationError, ServerError
 
+_BALANCE_VALUE = Decimal("1000.50")
+_TX_AMOUNT = Decimal("-50.00")
+_BOOKING_DATE = date(2024, 1, 15)
 
-def write_transactions_to_json(transactions, filename="transactions.json"):
-    """Write transactions to a JSON file.
-
-    Args:
-        transactions: List of transaction objects
-        filename: Output JSON filename
-    """
-    output_path = Path(filename)
-
-    # Convert transactions to JSON-serializable format
-    transactions_data = []
-    for tx in transactions:
-        tx_dict = {
-            "bookingStatus": tx.bookingStatus,
-            "reference": tx.reference,
-            "valutaDate": str(tx.valutaDate) if tx.valutaDate else None,
-            "newTransaction": tx.newTransaction,
-            "bookingDate": str(tx.bookingDate) if tx.bookingDate else None,
-            "remittanceLines": tx.remittance_lines,  # Parsed lines with markers stripped
-            "amount": {
-                "value": str(tx.amount.value) if tx.amount else None,
-                "unit": tx.amount.unit if tx.amount else None,
-            },
-            "transactionType": tx.transactionType,
-            "remitter": tx.remitter,
-            "debtor": tx.debtor,
-            "creditor": tx.creditor,
-        }
-        transactions_data.append(tx_dict)
-
-    # Write to JSON file
-    with open(output_path, "w") as f:
-        json.dump(transactions_data, f, indent=2, default=str)
-
-    print(f"Wrote {len(transactions_data)} transactions to {output_path}")
-
-
-@pytest.fixture
-def mock_httpx_client():
-    """Mock httpx AsyncClient."""
-    return AsyncMock(spec=httpx.AsyncClient)
-
-
-@pytest.fixture
-def authenticated_client(mock_httpx_client):
-    """Create an authenticated client with mocked HTTP."""
-    from datetime import datetime, timedelta, timezone
-
-    with patch("comdirect_client.client.httpx.AsyncClient", return_value=mock_httpx_client):
-        client = ComdirectClient(
-            client_id="test_id",
-            client_secret="test_secret",
-            username="test_user",
-            password="test_pass",
-        )
-        client._http_client = mock_httpx_client
-        # Set tokens to simulate authenticated state (use UTC-aware datetime)
-        client._access_token = "test_access_token"
-        client._refresh_token = "test_refresh_token"
-        client._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)  # Valid for 1 hour
-        client._session_id = "test_session_id"
-        yield client
+_BALANCES_PATH = "/api/banking/clients/user/v2/accounts/balances"
+_TRANSACTIONS_PATH = "/api/banking/v1/accounts/test_account_id/transactions"
 
 
 class TestAccountBalancesRetrieval:
@@ -83,37 +21,31 @@ class TestAccountBalancesRetrieval:
 
     @pytest.mark.asyncio
     async def test_retrieve_account_balances_successfully(
-        self, authenticated_client, mock_httpx_client, log_capture
+        self, authenticated_client, http_router, log_capture
     ):
         """Test successfully retrieving account balances."""
         log_capture.set_level(logging.DEBUG)
 
         # Mock response
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(
-            return_value={
-                "values": [
-                    {
+        payload = {
+            "values": [
+                {
+                    "accountId": "test_account_id",
+                    "account": {
                         "accountId": "test_account_id",
-                        "account": {
-                            "accountId": "test_account_id",
-                            "accountDisplayId": "DE89370400440532013000",
-                            "currency": "EUR",
-                            "clientId": "test_client_id",
-                            "accountType": {"key": "GIRO", "text": "Girokonto"},
-                        },
-                        "balance": {"value": "1000.50", "unit": "EUR"},
-                        "balanceEUR": {"value": "1000.50", "unit": "EUR"},
-                        "availableCashAmount": {"value": "950.00", "unit": "EUR"},
-                        "availableCashAmountEUR": {"value": "950.00", "unit": "EUR"},
-                    }
-                ]
-            }
-        )
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
+                        "accountDisplayId": "DE89370400440532013000",
+                        "currency": "EUR",
+                        "clientId": "test_client_id",
+                        "accountType": {"key": "GIRO", "text": "Girokonto"},
+                    },
+                    "balance": {"value": str(_BALANCE_VALUE), "unit": "EUR"},
+                    "balanceEUR": {"value": str(_BALANCE_VALUE), "unit": "EUR"},
+                    "availableCashAmount": {"value": "950.00", "unit": "EUR"},
+                    "availableCashAmountEUR": {"value": "950.00", "unit": "EUR"},
+                }
+            ]
+        }
+        http_router.route(_BALANCES_PATH, payload)
 
         # Call method
         balances = await authenticated_client.get_account_balances()
@@ -121,76 +53,42 @@ class TestAccountBalancesRetrieval:
         # Verify
         assert len(balances) == 1
         assert balances[0].accountId == "test_account_id"
-        assert balances[0].balance.value == Decimal("1000.50")
+        assert balances[0].balance.value == _BALANCE_VALUE
         assert balances[0].account.accountDisplayId == "DE89370400440532013000"
 
     @pytest.mark.asyncio
-    async def test_get_account_balances_without_attributes(
-        self, authenticated_client, mock_httpx_client
-    ):
-        """Test retrieving account balances without account attributes."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(return_value={"values": []})
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        # Call with with_attributes=False
-        await authenticated_client.get_account_balances(with_attributes=False)
-
-        # Verify the request was made with correct parameter
-        call_args = mock_httpx_client.get.call_args
-        assert "without-attr" in call_args.kwargs["params"]
-        assert call_args.kwargs["params"]["without-attr"] == "account"
-
-    @pytest.mark.asyncio
-    async def test_get_account_balances_without_specific_attributes(
-        self, authenticated_client, mock_httpx_client
+    @pytest.mark.parametrize(
+        "kwargs, param, expected",
+        [
+            ({"with_attributes": False}, "without-attr", "account"),
+            ({"without_attributes": "account,balance"}, "without-attr", "account,balance"),
+        ],
+        ids=["without_attributes", "without_specific_attributes"],
+    )
+    async def test_get_account_balances_query_params(
+        self, authenticated_client, http_router, kwargs, param, expected
     ):
-        """Test retrieving account balances without specific attributes."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(return_value={"values": []})
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
+        """Test that account balance options are passed through as query parameters."""
+        http_router.route(_BALANCES_PATH, {"values": []})
 
-        # Call with specific attributes to exclude
-        await authenticated_client.get_account_balances(without_attributes="account,balance")
+        await authenticated_client.get_account_balances(**kwargs)
 
         # Verify the request was made with correct parameter
-        call_args = mock_httpx_client.get.call_args
-        assert call_args.kwargs["params"]["without-attr"] == "account,balance"
+        assert http_router.requests[-1].url.params[param] == expected
 
     @pytest.mark.asyncio
-    async def test_account_balances_422_validation_error(
-        self, authenticated_client, mock_httpx_client
+    @pytest.mark.parametrize(
+        "status, exc",
+        [(422, ValidationError), (500, ServerError)],
+        ids=["422_validation_error", "500_server_error"],
+    )
+    async def test_account_balances_error_mapping(
+        self, authenticated_client, http_router, status, exc
     ):
-        """Test handling 422 validation error in account balances request."""
-        response = Mock()
-        response.status_code = 422
-        response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError("422", request=Mock(), response=response)
-        )
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
+        """Test that account balance HTTP errors map to library exceptions."""
+        http_router.route(_BALANCES_PATH, status=status)
 
-        with pytest.raises(ValidationError):
-            await authenticated_client.get_account_balances()
-
-    @pytest.mark.asyncio
-    async def test_account_balances_500_server_error(self, authenticated_client, mock_httpx_client):
-        """Test handling 500 server error in account balances request."""
-        response = Mock()
-        response.status_code = 500
-        response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError("500", request=Mock(), response=response)
-        )
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        with pytest.raises(ServerError):
+        with pytest.raises(exc):
             await authenticated_client.get_account_balances()
 
 
@@ -199,218 +97,102 @@ class TestTransactionRetrieval:
 
     @pytest.mark.asyncio
     async def test_retrieve_transactions_successfully(
-        self, authenticated_client, mock_httpx_client, log_capture
+        self, authenticated_client, http_router, log_capture
     ):
         """Test successfully retrieving transactions."""
         log_capture.set_level(logging.DEBUG)
 
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(
-            return_value={
-                "values": [
-                    {
-                        "bookingStatus": "BOOKED",
-                        "reference": "Test reference",
-                        "valutaDate": "2024-01-15",
-                        "newTransaction": False,
-                        "amount": {"value": "-50.00", "unit": "EUR"},
-                        "bookingDate": "2024-01-15",
-                        "remittanceInfo": "Payment for services",
-                    }
-                ]
-            }
-        )
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
+        payload = {
+            "values": [
+                {
+                    "bookingStatus": "BOOKED",
+                    "reference": "Test reference",
+                    "valutaDate": "2024-01-15",
+                    "newTransaction": False,
+                    "amount": {"value": str(_TX_AMOUNT), "unit": "EUR"},
+                    "bookingDate": _BOOKING_DATE.isoformat(),
+                    "remittanceInfo": "Payment for services",
+                }
+            ]
+        }
+        http_router.route(_TRANSACTIONS_PATH, payload)
 
         # Call method
         transactions = await authenticated_client.get_transactions("test_account_id")
 
-        # Write transactions to JSON file
-        write_transactions_to_json(transactions, "transactions.json")
-
         # Verify
         assert len(transactions) == 1
         assert transactions[0].bookingStatus == "BOOKED"
-        assert transactions[0].amount.value == Decimal("-50.00")
-        assert transactions[0].bookingDate == date(2024, 1, 15)
+        assert transactions[0].amount.value == _TX_AMOUNT
+        assert transactions[0].bookingDate == _BOOKING_DATE
 
     @pytest.mark.asyncio
-    async def test_retrieve_transactions_with_direction_filter(
-        self, authenticated_client, mock_httpx_client
+    @pytest.mark.parametrize(
+        "kwargs, param, expected",
+        [
+            ({"transaction_direction": "DEBIT"}, "transactionDirection", "DEBIT"),
+            ({"transaction_state": "BOOKED"}, "transactionState", "BOOKED"),
+            ({}, "paging-count", "500"),
+            ({"with_attributes": False}, "without-attr", "account"),
+            ({"without_attributes": "account,booking"}, "without-attr", "account,booking"),
+        ],
+        ids=[
+            "direction_filter",
+            "state_filter",
+            "always_fetches_max",
+            "without_attributes",
+            "without_specific_attributes",
+        ],
+    )
+    async def test_retrieve_transactions_query_params(
+        self, authenticated_client, http_router, kwargs, param, expected
     ):
-        """Test retrieving transactions with direction filter."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(return_value={"values": []})
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        await authenticated_client.get_transactions(
-            "test_account_id", transaction_direction="DEBIT"
-        )
-
-        # Verify the request includes the direction parameter
-        call_args = mock_httpx_client.get.call_args
-        assert call_args.kwargs["params"]["transactionDirection"] == "DEBIT"
-
-    @pytest.mark.asyncio
-    async def test_retrieve_transactions_with_state_filter(
-        self, authenticated_client, mock_httpx_client
-    ):
-        """Test retrieving transactions with state filter."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(return_value={"values": []})
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
+        """Test that transaction filters and options are passed through as query parameters."""
+        http_router.route(_TRANSACTIONS_PATH, {"values": []})
 
-        await authenticated_client.get_transactions("test_account_id", transaction_state="BOOKED")
-
-        # Verify the request includes the state parameter
-        call_args = mock_httpx_client.get.call_args
-        assert call_args.kwargs["params"]["transactionState"] == "BOOKED"
-
-    @pytest.mark.asyncio
-    async def test_retrieve_transactions_always_fetches_max(
-        self, authenticated_client, mock_httpx_client
-    ):
-        """Test that get_transactions always uses paging-count=500."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(return_value={"values": []})
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        await authenticated_client.get_transactions("test_account_id")
-
-        # Verify paging-count is always 500
-        call_args = mock_httpx_client.get.call_args
-        assert call_args.kwargs["params"]["paging-count"] == "500"
-
-    @pytest.mark.asyncio
-    async def test_retrieve_transactions_without_attributes(
-        self, authenticated_client, mock_httpx_client
-    ):
-        """Test retrieving transactions without account attributes."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(return_value={"values": []})
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        await authenticated_client.get_transactions("test_account_id", with_attributes=False)
+        await authenticated_client.get_transactions("test_account_id", **kwargs)
 
         # Verify the request was made with correct parameter
-        call_args = mock_httpx_client.get.call_args
-        assert call_args.kwargs["params"]["without-attr"] == "account"
+        assert http_router.requests[-1].url.params[param] == expected
 
     @pytest.mark.asyncio
-    async def test_retrieve_transactions_without_specific_attributes(
-        self, authenticated_client, mock_httpx_client
-    ):
-        """Test retrieving transactions without specific attributes."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(return_value={"values": []})
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        await authenticated_client.get_transactions(
-            "test_account_id", without_attributes="account,booking"
-        )
-
-        # Verify the request was made with correct parameter
-        call_args = mock_httpx_client.get.call_args
-        assert call_args.kwargs["params"]["without-attr"] == "account,booking"
-
-    @pytest.mark.asyncio
-    async def test_transactions_404_account_not_found(
-        self, authenticated_client, mock_httpx_client
-    ):
-        """Test handling 404 when account not found."""
-        response = Mock()
-        response.status_code = 404
-        response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError("404", request=Mock(), response=response)
-        )
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        with pytest.raises(AccountNotFoundError):
-            await authenticated_client.get_transactions("nonexistent_account_id")
-
-    @pytest.mark.asyncio
-    async def test_transactions_422_validation_error(self, authenticated_client, mock_httpx_client):
-        """Test handling 422 validation error in transactions request."""
-        response = Mock()
-        response.status_code = 422
-        response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError("422", request=Mock(), response=response)
-        )
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        with pytest.raises(ValidationError):
+    @pytest.mark.parametrize(
+        "status, exc",
+        [(404, AccountNotFoundError), (422, ValidationError), (500, ServerError)],
+        ids=["404_account_not_found", "422_validation_error", "500_server_error"],
+    )
+    async def test_transactions_error_mapping(self, authenticated_client, http_router, status, exc):
+        """Test that transaction HTTP errors map to library exceptions."""
+        http_router.route(_TRANSACTIONS_PATH, status=status)
+
+        with pytest.raises(exc):
             await authenticated_client.get_transactions("test_account_id")
 
     @pytest.mark.asyncio
-    async def test_transactions_500_server_error(self, authenticated_client, mock_httpx_client):
-        """Test handling 500 server error in transactions request."""
-        response = Mock()
-        response.status_code = 500
-        response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError("500", request=Mock(), response=response)
-        )
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
-
-        with pytest.raises(ServerError):
-            await authenticated_client.get_transactions("test_account_id")
-
-    @pytest.mark.asyncio
-    async def test_transactions_with_null_optional_fields(
-        self, authenticated_client, mock_httpx_client
-    ):
+    async def test_transactions_with_null_optional_fields(self, authenticated_client, http_router):
         """Test parsing transactions with null optional fields."""
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(
-            return_value={
-                "values": [
-                    {
-                        "bookingStatus": "BOOKED",
-                        "reference": "Test",
-                        "valutaDate": "2024-01-15",
-                        "newTransaction": False,
-                        "amount": None,
-                        "bookingDate": None,
-                        "transactionType": None,
-                        "remittanceInfo": None,
-                        "remitter": None,
-                        "debtor": None,
-                        "creditor": None,
-                    }
-                ]
-            }
-        )
-        response.raise_for_status = Mock()
-
-        mock_httpx_client.get = AsyncMock(return_value=response)
+        payload = {
+            "values": [
+                {
+                    "bookingStatus": "BOOKED",
+                    "reference": "Test",
+                    "valutaDate": "2024-01-15",
+                    "newTransaction": False,
+                    "amount": None,
+                    "bookingDate": None,
+                    "transactionType": None,
+                    "remittanceInfo": None,
+                    "remitter": None,
+                    "debtor": None,
+                    "creditor": None,
+                }
+            ]
+        }
+        http_router.route(_TRANSACTIONS_PATH, payload)
 
         # Should not raise an exception
         transactions = await authenticated_client.get_transactions("test_account_id")
 
-        # Write transactions to JSON file
-        write_transactions_to_json(transactions, "transactions_with_nulls.json")
-
         assert len(transactions) == 1
         assert transactions[0].amount is None
         assert transactions[0].bookingDate is None
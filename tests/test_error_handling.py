@@ -1,178 +1,124 @@
 """Integration tests for HTTP error handling and query parameters."""
 
 import pytest
-from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from comdirect_client import (
-    ComdirectClient,
     ValidationError,
     ServerError,
 )
 
-
-def utc_now() -> datetime:
-    """Get current UTC time as timezone-aware datetime."""
-    return datetime.now(timezone.utc)
-
-
-@pytest.fixture
-def client():
-    """Create a ComdirectClient instance for testing."""
-    client = ComdirectClient(
-        client_id="test_id",
-        client_secret="test_secret",
-        username="test_user",
-        password="test_pass",
-    )
-    # Set up minimal authentication state (use UTC-aware datetime)
-    client._access_token = "test_token"
-    client._token_expiry = utc_now() + timedelta(hours=1)
-    return client
+_BALANCES_PATH = "/api/banking/clients/user/v2/accounts/balances"
+_TRANSACTIONS_PATH = "/api/banking/v1/accounts/test_account_id/transactions"
 
 
 class TestValidationErrorHandling:
     """Test 422 Unprocessable Entity error handling."""
 
     @pytest.mark.asyncio
-    async def test_account_balances_422_validation_error(self, client):
+    async def test_account_balances_422_validation_error(self, authenticated_client, http_router):
         """Test that 422 response raises ValidationError for account balances."""
         # Mock HTTP response with 422 status
-        mock_response = MagicMock()
-        mock_response.status_code = 422
-
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        http_router.route(_BALANCES_PATH, status=422)
 
-            with pytest.raises(ValidationError) as exc_info:
-                await client.get_account_balances(without_attributes="invalid_attr")
+        with pytest.raises(ValidationError) as exc_info:
+            await authenticated_client.get_account_balances(without_attributes="invalid_attr")
 
-            assert "Invalid request parameters" in str(exc_info.value)
-            assert mock_get.called
+        assert "Invalid request parameters" in str(exc_info.value)
+        assert http_router.requests
 
     @pytest.mark.asyncio
-    async def test_transactions_422_validation_error(self, client):
+    async def test_transactions_422_validation_error(self, authenticated_client, http_router):
         """Test that 422 response raises ValidationError for transactions."""
-        mock_response = MagicMock()
-        mock_response.status_code = 422
+        http_router.route(_TRANSACTIONS_PATH, status=422)
 
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
-
-            with pytest.raises(ValidationError) as exc_info:
-                await client.get_transactions("test_account_id", without_attributes="invalid_attr")
+        with pytest.raises(ValidationError) as exc_info:
+            await authenticated_client.get_transactions(
+                "test_account_id", without_attributes="invalid_attr"
+            )
 
-            assert "Invalid request parameters" in str(exc_info.value)
+        assert "Invalid request parameters" in str(exc_info.value)
 
 
 class TestServerErrorHandling:
     """Test 500 Internal Server Error handling."""
 
     @pytest.mark.asyncio
-    async def test_account_balances_500_server_error(self, client):
+    async def test_account_balances_500_server_error(self, authenticated_client, http_router):
         """Test that 500 response raises ServerError for account balances."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        http_router.route(_BALANCES_PATH, status=500)
 
-            with pytest.raises(ServerError) as exc_info:
-                await client.get_account_balances()
+        with pytest.raises(ServerError) as exc_info:
+            await authenticated_client.get_account_balances()
 
-            assert "500 Internal Server Error" in str(exc_info.value)
+        assert "500 Internal Server Error" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_transactions_500_server_error(self, client):
+    async def test_transactions_500_server_error(self, authenticated_client, http_router):
         """Test that 500 response raises ServerError for transactions."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
+        http_router.route(_TRANSACTIONS_PATH, status=500)
 
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        with pytest.raises(ServerError) as exc_info:
+            await authenticated_client.get_transactions("test_account_id")
 
-            with pytest.raises(ServerError) as exc_info:
-                await client.get_transactions("test_account_id")
-
-            assert "500 Internal Server Error" in str(exc_info.value)
+        assert "500 Internal Server Error" in str(exc_info.value)
 
 
 class TestQueryParameterExposure:
     """Test that query parameters are correctly exposed and sent."""
 
     @pytest.mark.asyncio
-    async def test_account_balances_without_attributes_parameter(self, client):
+    async def test_account_balances_without_attributes_parameter(
+        self, authenticated_client, http_router
+    ):
         """Test that without_attributes parameter is included in request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"values": []}
-
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        http_router.route(_BALANCES_PATH, {"values": []})
 
-            await client.get_account_balances(with_attributes=False)
+        await authenticated_client.get_account_balances(with_attributes=False)
 
-            # Verify the call includes query parameters
-            mock_get.assert_called_once()
-            call_args = mock_get.call_args
-
-            # Check that params are passed
-            assert "params" in call_args.kwargs
-            assert call_args.kwargs["params"] == {"without-attr": "account"}
+        # Verify the request carried the query parameters
+        assert len(http_router.requests) == 1
+        assert dict(http_router.requests[-1].url.params) == {"without-attr": "account"}
 
     @pytest.mark.asyncio
-    async def test_account_balances_custom_without_attributes(self, client):
+    async def test_account_balances_custom_without_attributes(
+        self, authenticated_client, http_router
+    ):
         """Test custom without_attributes parameter."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"values": []}
-
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        http_router.route(_BALANCES_PATH, {"values": []})
 
-            await client.get_account_balances(without_attributes="balance,currency")
+        await authenticated_client.get_account_balances(without_attributes="balance,currency")
 
-            call_args = mock_get.call_args
-            assert call_args.kwargs["params"] == {"without-attr": "balance,currency"}
+        assert dict(http_router.requests[-1].url.params) == {"without-attr": "balance,currency"}
 
     @pytest.mark.asyncio
-    async def test_transactions_without_attributes_parameter(self, client):
+    async def test_transactions_without_attributes_parameter(
+        self, authenticated_client, http_router
+    ):
         """Test that transactions without_attributes parameter works."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"values": []}
+        http_router.route(_TRANSACTIONS_PATH, {"values": []})
 
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        await authenticated_client.get_transactions("test_account_id", with_attributes=False)
 
-            await client.get_transactions("test_account_id", with_attributes=False)
-
-            call_args = mock_get.call_args
-            assert call_args.kwargs["params"] == {"paging-count": "500", "without-attr": "account"}
+        params = dict(http_router.requests[-1].url.params)
+        assert params == {"paging-count": "500", "without-attr": "account"}
 
     @pytest.mark.asyncio
-    async def test_transactions_combined_parameters(self, client):
+    async def test_transactions_combined_parameters(self, authenticated_client, http_router):
         """Test transactions with multiple query parameters."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"values": []}
-
-        with patch.object(client._http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        http_router.route(_TRANSACTIONS_PATH, {"values": []})
 
-            await client.get_transactions(
-                "test_account_id",
-                transaction_direction="CREDIT",
-                without_attributes="booking",
-            )
+        await authenticated_client.get_transactions(
+            "test_account_id",
+            transaction_direction="CREDIT",
+            without_attributes="booking",
+        )
 
-            call_args = mock_get.call_args
-            params = call_args.kwargs["params"]
+        params = http_router.requests[-1].url.params
 
-            # Verify all parameters are present
-            assert params["transactionDirection"] == "CREDIT"
-            assert params["paging-count"] == "500"
-            assert params["without-attr"] == "booking"
+        # Verify all parameters are present
+        assert params["transactionDirection"] == "CREDIT"
+        assert params["paging-count"] == "500"
+        assert params["without-attr"] == "booking"
 
 
 class TestFieldNameFallback:
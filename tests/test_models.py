@@ -3,6 +3,7 @@
 from datetime import date
 from decimal import Decimal
 
+from comdirect_client.client import ComdirectClient
 from comdirect_client.models import (
     Account,
     AccountBalance,
@@ -55,6 +56,12 @@ class TestEnumTextModel:
         assert enum.key == "GIRO"
         assert enum.text == "Girokonto"
 
+    def test_enum_text_instances_are_shared(self):
+        """Test that identical EnumText values resolve to one shared instance."""
+        data = {"key": "GIRO", "text": "Girokonto"}
+
+        assert EnumText.from_dict(data) is EnumText.from_dict(dict(data))
+
 
 class TestAccountInformationModel:
     """Test AccountInformation model."""
@@ -83,6 +90,21 @@ class TestAccountInformationModel:
         assert info.iban is None
         assert info.bic is None
 
+    def test_account_information_instances_are_shared(self):
+        """Test that identical counterparties resolve to one shared instance."""
+        data = {"holderName": "John Doe", "iban": "DE89370400440532013000", "bic": "COBADEFFXXX"}
+
+        assert AccountInformation.from_dict(data) is AccountInformation.from_dict(dict(data))
+
+    async def test_shared_instances_released_on_client_close(self, credentials):
+        """Test that closing a client drops cached counterparty data."""
+        data = {"holderName": "John Doe", "iban": "DE89370400440532013000", "bic": "COBADEFFXXX"}
+        before = AccountInformation.from_dict(data)
+
+        await ComdirectClient(**credentials).close()
+
+        assert AccountInformation.from_dict(data) is not before
+
 
 class TestAccountModel:
     """Test Account model."""
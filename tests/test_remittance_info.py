@@ -54,3 +54,24 @@ def test_remittance_lines_ignores_leading_whitespace_and_empty_parts() -> None:
     remittance = " 01First  02  Second   03   "
     tx = make_transaction(remittance)
     assert tx.remittance_lines == ["First", "Second"]
+
+
+def test_remittance_lines_long_format_fixed_width_markers() -> None:
+    remittance = (
+        "01Lastschrift Stadtwerke Musterstadt "
+        "02Kundennr 4711 Rechnung 2024-01     "
+        "03End-to-End-Ref.: 123456789        "
+        "04CORE / Mandatsref.: M-12"
+    )
+    tx = make_transaction(remittance)
+    assert tx.remittance_lines == [
+        "Lastschrift Stadtwerke Musterstadt",
+        "Kundennr 4711 Rechnung 2024-01",
+        "End-to-End-Ref.: 123456789",
+        "CORE / Mandatsref.: M-12",
+    ]
+
+
+def test_remittance_lines_without_marker_is_single_line() -> None:
+    tx = make_transaction("Kartenzahlung 2024-01-15")
+    assert tx.remittance_lines == ["Kartenzahlung 2024-01-15"]
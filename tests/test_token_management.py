@@ -1,223 +1,128 @@
 """Token refresh and callback tests."""
 
 import logging
-from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, Mock, patch
+from datetime import timedelta
+from unittest.mock import Mock
 
-import httpx
 import pytest
 
 from comdirect_client.client import ComdirectClient
 from comdirect_client.exceptions import TokenExpiredError
 
+LOGGER = logging.getLogger("comdirect_client")
 
-def utc_now() -> datetime:
-    """Get current UTC time as timezone-aware datetime."""
-    return datetime.now(timezone.utc)
+_REFRESH_PAYLOAD = {
+    "access_token": "new_access_token",
+    "refresh_token": "new_refresh_token",
+    "expires_in": 600,
+}
 
 
-@pytest.fixture
-def mock_httpx_client():
-    """Mock httpx AsyncClient."""
-    return AsyncMock(spec=httpx.AsyncClient)
+_TOKEN_PATH = "/oauth/token"
 
 
 @pytest.fixture
-def authenticated_client_with_expiry(mock_httpx_client):
-    """Create an authenticated client that will expire soon."""
-    with patch("comdirect_client.client.httpx.AsyncClient", return_value=mock_httpx_client):
-        client = ComdirectClient(
-            client_id="test_id",
-            client_secret="test_secret",
-            username="test_user",
-            password="test_pass",
-            token_refresh_threshold_seconds=120,
-        )
-        client._http_client = mock_httpx_client
-        client._access_token = "test_access_token"
-        client._refresh_token = "test_refresh_token"
-        client._token_expiry = utc_now() + timedelta(seconds=150)  # Expires in 150 seconds
-        client._session_id = "test_session_id"
-        yield client
+def authenticated_client_with_expiry(authenticated_client, frozen_clock):
+    """Authenticated shared client whose token expires in 150 seconds."""
+    authenticated_client._token_expiry = frozen_clock + timedelta(seconds=150)
+    return authenticated_client
 
 
 class TestTokenRefresh:
     """Test token refresh functionality."""
 
     @pytest.mark.asyncio
-    async def test_token_refresh_succeeds(
-        self, authenticated_client_with_expiry, mock_httpx_client, log_capture
+    @pytest.mark.parametrize(
+        "status, expected, register_callback",
+        [(200, True, False), (401, False, False), (401, False, True)],
+        ids=["succeeds", "fails_with_401", "reauth_callback_invoked_on_failure"],
+    )
+    async def test_token_refresh(
+        self,
+        authenticated_client_with_expiry,
+        http_router,
+        log_capture,
+        status,
+        expected,
+        register_callback,
     ):
-        """Test successful token refresh."""
-        log_capture.set_level(logging.DEBUG)
-
-        # Mock refresh response
-        response = Mock()
-        response.status_code = 200
-        response.json = Mock(
-            return_value={
-                "access_token": "new_access_token",
-                "refresh_token": "new_refresh_token",
-                "expires_in": 600,
-            }
-        )
-        response.raise_for_status = Mock()
+        """Test token refresh outcome and reauth callback for each response status."""
+        client = authenticated_client_with_expiry
+        http_router.route(_TOKEN_PATH, _REFRESH_PAYLOAD if status == 200 else None, status)
 
-        mock_httpx_client.post = AsyncMock(return_value=response)
+        # Register callback
+        callback = Mock()
+        if register_callback:
+            client.register_reauth_callback(callback)
 
         # Manually call refresh (normally done by background task)
-        success = await authenticated_client_with_expiry.refresh_token()
+        success = await client.refresh_token()
 
-        # Verify
-        assert success
-        assert authenticated_client_with_expiry._access_token == "new_access_token"
-        assert authenticated_client_with_expiry._refresh_token == "new_refresh_token"
+        assert success is expected
+        assert http_router.requests[-1].url.path == _TOKEN_PATH
+        if expected:
+            assert client._access_token == "new_access_token"
+            assert client._refresh_token == "new_refresh_token"
+        if register_callback:
+            # Callback should be invoked
+            callback.assert_called_once_with("token_refresh_failed")
 
     @pytest.mark.asyncio
-    async def test_token_refresh_fails_with_401(
-        self, authenticated_client_with_expiry, mock_httpx_client, log_capture
+    async def test_expired_token_raises_error(
+        self, authenticated_client_with_expiry, http_router, frozen_clock
     ):
-        """Test token refresh fails with 401."""
-        log_capture.set_level(logging.DEBUG)
-
-        response = Mock()
-        response.status_code = 401
-        response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError("401", request=Mock(), response=response)
-        )
-
-        mock_httpx_client.post = AsyncMock(return_value=response)
-
-        # Refresh should fail
-        success = await authenticated_client_with_expiry.refresh_token()
-
-        assert not success
-
-    @pytest.mark.asyncio
-    async def test_reauth_callback_invoked_on_refresh_failure(
-        self, authenticated_client_with_expiry, mock_httpx_client, log_capture
-    ):
-        """Test reauth callback is invoked when refresh fails."""
-        log_capture.set_level(logging.DEBUG)
-
-        response = Mock()
-        response.status_code = 401
-        response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError("401", request=Mock(), response=response)
-        )
-
-        mock_httpx_client.post = AsyncMock(return_value=response)
-
-        # Register callback
-        callback_called = []
-
-        def test_callback(reason):
-            callback_called.append(reason)
-
-        authenticated_client_with_expiry.register_reauth_callback(test_callback)
-
-        # Refresh fails
-        success = await authenticated_client_with_expiry.refresh_token()
+        """Test that requests with expired token raise TokenExpiredError."""
+        client = authenticated_client_with_expiry
+        client._token_expiry = frozen_clock - timedelta(seconds=10)  # Already expired
 
-        assert not success
-        # Callback should be invoked
-        assert len(callback_called) > 0
+        http_router.route(_TOKEN_PATH, status=401)
 
-    @pytest.mark.asyncio
-    async def test_expired_token_raises_error(self, mock_httpx_client):
-        """Test that requests with expired token raise TokenExpiredError."""
-        with patch("comdirect_client.client.httpx.AsyncClient", return_value=mock_httpx_client):
-            client = ComdirectClient(
-                client_id="test_id",
-                client_secret="test_secret",
-                username="test_user",
-                password="test_pass",
-            )
-            client._http_client = mock_httpx_client
-            client._access_token = "test_access_token"
-            client._token_expiry = utc_now() - timedelta(seconds=10)  # Already expired
-            client._session_id = "test_session_id"
-
-            response = Mock()
-            response.status_code = 401
-            response.raise_for_status = Mock(
-                side_effect=httpx.HTTPStatusError("401", request=Mock(), response=response)
-            )
-
-            mock_httpx_client.get = AsyncMock(return_value=response)
-            mock_httpx_client.post = AsyncMock(return_value=response)
-
-            # Request with expired token should raise TokenExpiredError
-            with pytest.raises(TokenExpiredError):
-                await client.get_account_balances()
+        # Request with expired token should raise TokenExpiredError
+        with pytest.raises(TokenExpiredError):
+            await client.get_account_balances()
 
 
 class TestReauthCallback:
     """Test reauth callback mechanism."""
 
-    def test_register_callback(self):
+    def test_register_callback(self, credentials):
         """Test registering a reauth callback."""
-        client = ComdirectClient(
-            client_id="test_id",
-            client_secret="test_secret",
-            username="test_user",
-            password="test_pass",
-        )
-
-        callback_called = []
-
-        def test_callback(reason):
-            callback_called.append(reason)
+        client = ComdirectClient(**credentials)
 
-        client.register_reauth_callback(test_callback)
+        callback = Mock()
+        client.register_reauth_callback(callback)
 
-        assert client.reauth_callback is not None
-        assert client.reauth_callback == test_callback
+        assert client.reauth_callback is callback
 
-    def test_register_callback_via_init(self):
+    def test_register_callback_via_init(self, credentials):
         """Test registering callback via constructor."""
-        callback_called = []
+        callback = Mock()
 
-        def test_callback(reason):
-            callback_called.append(reason)
+        client = ComdirectClient(**credentials, reauth_callback=callback)
 
-        client = ComdirectClient(
-            client_id="test_id",
-            client_secret="test_secret",
-            username="test_user",
-            password="test_pass",
-            reauth_callback=test_callback,
-        )
-
-        assert client.reauth_callback == test_callback
+        assert client.reauth_callback is callback
 
 
 class TestLogging:
-    """Test logging behavior."""
+    """Test logging behavior.
+
+    The log_capture fixture already sets capture to DEBUG for every test.
+    """
 
     def test_logging_appropriate_levels(self, log_capture):
         """Test that appropriate logging levels are used."""
-        log_capture.set_level(logging.DEBUG)
-
-        # Create logger
-        logger = logging.getLogger("comdirect_client")
-
         # Log at different levels
-        logger.debug("DEBUG message")
-        logger.info("INFO message")
-        logger.warning("WARNING message")
-        logger.error("ERROR message")
+        LOGGER.debug("DEBUG message")
+        LOGGER.info("INFO message")
+        LOGGER.warning("WARNING message")
+        LOGGER.error("ERROR message")
 
         # Verify all levels are present
-        assert any(record.levelno == logging.DEBUG for record in log_capture.records)
-        assert any(record.levelno == logging.INFO for record in log_capture.records)
-        assert any(record.levelno == logging.WARNING for record in log_capture.records)
-        assert any(record.levelno == logging.ERROR for record in log_capture.records)
+        levels = {record.levelno for record in log_capture.records}
+        assert {logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR} <= levels
 
     def test_no_sensitive_data_in_logs(self, log_capture):
         """Test that sensitive data is not logged."""
-        log_capture.set_level(logging.DEBUG)
-
         # Log with client that has sensitive data
         ComdirectClient(
             client_id="test_id",
@@ -226,11 +131,8 @@ class TestLogging:
             password="test_password",
         )
 
-        # Password should not appear in logs
-        for record in log_capture.records:
-            assert "test_password" not in record.getMessage()
-            assert record.getMessage().lower().count("password") == 0
-
-        # Client secret should not appear in logs
-        for record in log_capture.records:
-            assert "test_secret" not in record.getMessage()
+        # Neither the password nor the client secret may appear in logs
+        messages = "\n".join(record.getMessage() for record in log_capture.records)
+        assert "test_password" not in messages
+        assert "password" not in messages.lower()
+        assert "test_secret" not in messages